@@ -5,21 +5,13 @@ Main server file for Taiga MCP Bridge.
 This file sets up the FastMCP server and registers all tools from the modular tool modules.
 """
 
+import importlib
 import logging
 import logging.config
+import os
+import time
 from mcp.server.fastmcp import FastMCP
 
-# Import tool registration functions
-from tools.auth import register_auth_tools
-from tools.project import register_project_tools  
-from tools.story import register_story_tools
-from tools.task import register_task_tools
-from tools.issue import register_issue_tools
-from tools.epic import register_epic_tools
-from tools.milestone import register_milestone_tools
-from tools.user import register_user_tools
-from tools.wiki import register_wiki_tools
-
 # --- Logging Setup ---
 logging.basicConfig(
     level=logging.INFO,
@@ -33,42 +25,57 @@ logger = logging.getLogger(__name__)
 logging.getLogger("pytaigaclient").setLevel(logging.WARNING)
 
 # --- MCP Server Definition ---
+# Only packages imported at runtime are listed (anyio ships with mcp itself).
+# Tool modules are imported lazily in register_all_tools().
 mcp = FastMCP(
     "Taiga Bridge (Session ID)",
-    dependencies=["pytaigaclient"]
+    dependencies=["pytaigaclient", "requests", "httpx"]
 )
 
 # --- Register All Tools ---
+# (module, registration function, label). Modules are imported on demand so
+# toolsets disabled via TAIGA_TOOLSETS are never loaded.
+TOOL_MODULES = [
+    ("auth", "register_auth_tools", "authentication"),
+    ("project", "register_project_tools", "project management"),
+    ("story", "register_story_tools", "user story"),
+    ("task", "register_task_tools", "task management"),
+    ("issue", "register_issue_tools", "issue management"),
+    ("epic", "register_epic_tools", "epic management"),
+    ("milestone", "register_milestone_tools", "milestone/sprint"),
+    ("user", "register_user_tools", "user management"),
+    ("wiki", "register_wiki_tools", "wiki page"),
+    # Registered last: dispatches to the tools registered above
+    ("batch", "register_batch_tools", "batch execution"),
+]
+
+
+def _enabled_toolsets() -> set:
+    """Returns the toolsets selected via TAIGA_TOOLSETS (comma-separated), or all of them."""
+    selected = os.getenv("TAIGA_TOOLSETS", "")
+    names = {name.strip() for name in selected.split(",") if name.strip()}
+    # Sessions are created by the auth tools, so they are always registered
+    return names | {"auth"} if names else {module for module, _, _ in TOOL_MODULES}
+
+
 def register_all_tools():
-    """Register all tool modules with the FastMCP instance."""
-    logger.info("Registering authentication tools...")
-    register_auth_tools(mcp)
-    
-    logger.info("Registering project management tools...")
-    register_project_tools(mcp)
-    
-    logger.info("Registering user story tools...")
-    register_story_tools(mcp)
-    
-    logger.info("Registering task management tools...")
-    register_task_tools(mcp)
-    
-    logger.info("Registering issue management tools...")
-    register_issue_tools(mcp)
-    
-    logger.info("Registering epic management tools...")
-    register_epic_tools(mcp)
-    
-    logger.info("Registering milestone/sprint tools...")
-    register_milestone_tools(mcp)
-    
-    logger.info("Registering user management tools...")
-    register_user_tools(mcp)
-    
-    logger.info("Registering wiki page tools...")
-    register_wiki_tools(mcp)
-    
-    logger.info("All tool modules registered successfully.")
+    """Register all enabled tool modules with the FastMCP instance."""
+    enabled = _enabled_toolsets()
+    started = time.perf_counter()
+    for module_name, register_name, label in TOOL_MODULES:
+        if module_name not in enabled:
+            logger.info("Skipping %s tools (not in TAIGA_TOOLSETS).", label)
+            continue
+        logger.info("Registering %s tools...", label)
+        module_started = time.perf_counter()
+        module = importlib.import_module(f"tools.{module_name}")
+        getattr(module, register_name)(mcp)
+        logger.debug("Registered %s tools in %.1fms", label, (time.perf_counter() - module_started) * 1000)
+
+    # Tool schemas are built once here; FastMCP reuses them for every list/call request
+    tool_count = len(mcp._tool_manager.list_tools())
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info("All tool modules registered successfully (%d tools in %.1fms).", tool_count, elapsed_ms)
 
 # Register all tools when the module is imported
 register_all_tools()
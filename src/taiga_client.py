@@ -1,6 +1,8 @@
 # taiga_client.py
 from typing import Optional
 import logging
+import requests
+from requests.adapters import HTTPAdapter
 # Replace python-taiga import
 # from taiga import TaigaAPI
 # from taiga.exceptions import TaigaException
@@ -18,15 +20,34 @@ class TaigaClientWrapper:
     and authentication state.
     """
 
-    def __init__(self, host: str):
+    def __init__(self, host: str, adapter: Optional[HTTPAdapter] = None):
         if not host:
             raise ValueError("Taiga host URL cannot be empty.")
         # Store host, but initialize client later during login/token auth
         self.host = host
+        # Optional shared connection pool mounted on the client's HTTP session
+        self.adapter = adapter
         # Use the new client type
         self.api: Optional[TaigaClient] = None
         logger.info(f"TaigaClientWrapper initialized for host: {self.host}")
 
+    @staticmethod
+    def _http_sessions(api_instance: TaigaClient) -> list:
+        """Returns the requests.Session objects held by the client."""
+        return [value for value in vars(api_instance).values()
+                if isinstance(value, requests.Session)]
+
+    def _mount_adapter(self, api_instance: TaigaClient) -> None:
+        """Mounts the shared adapter on any requests.Session held by the client."""
+        if self.adapter is None:
+            return
+        sessions = self._http_sessions(api_instance)
+        if not sessions:
+            logger.debug("pytaigaclient exposes no requests.Session; using its default transport.")
+        for session in sessions:
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+
     def login(self, username: str, password: str) -> bool:
         """
         Authenticates with the Taiga instance using username and password.
@@ -37,6 +58,7 @@ class TaigaClientWrapper:
                 f"Attempting login for user '{username}' on {self.host}")
             # Initialize the client here
             api_instance = TaigaClient(host=self.host)
+            self._mount_adapter(api_instance)
             # Use the auth resource's login method
             api_instance.auth.login(username=username, password=password)
             self.api = api_instance
@@ -55,6 +77,17 @@ class TaigaClientWrapper:
             # Wrap unexpected errors in TaigaException if needed, or re-raise
             raise TaigaException(f"Unexpected login error: {e}")
 
+    def close(self) -> None:
+        """
+        Drops the API client and its auth token. A shared adapter's connections
+        stay open for other sessions; a private HTTP session is closed.
+        """
+        api_instance, self.api = self.api, None
+        if api_instance is None or self.adapter is not None:
+            return
+        for session in self._http_sessions(api_instance):
+            session.close()
+
     # Add method for token authentication if needed by pytaigaclient
     # def set_token(self, token: str, token_type: str = "Bearer"):
     #     logger.info(f"Initializing TaigaClient with token on {self.host}")
@@ -5,15 +5,7 @@ This package contains modular tool implementations for the Taiga MCP bridge,
 organized by functionality for better maintainability.
 """
 
-from .auth import *
-from .project import *
-from .story import *
-from .task import *
-from .issue import *
-from .epic import *
-from .milestone import *
-from .user import *
-from .wiki import *
+import importlib
 
 __all__ = [
     # Auth tools
@@ -51,12 +43,15 @@ __all__ = [
     "unassign_task_from_user",
     "search_users",
     "assign_task_by_username",
+    "bulk_assign_tasks_by_username",
+    "bulk_search_users",
     "get_task_activity",
     "add_task_tags",
     
     # Issue tools
     "list_issues",
     "create_issue",
+    "bulk_create_issues",
     "get_issue",
     "update_issue",
     "delete_issue", 
@@ -66,6 +61,7 @@ __all__ = [
     "get_issue_priorities",
     "get_issue_severities", 
     "get_issue_types",
+    "get_issue_metadata",
     
     # Epic tools
     "list_epics",
@@ -86,8 +82,54 @@ __all__ = [
     # User management tools  
     "get_project_members",
     "invite_project_user",
+    "refresh_project_members",
     
     # Wiki tools
     "list_wiki_pages",
-    "get_wiki_page"
+    "get_wiki_page",
+
+    # Batch tools
+    "batch_execute"
 ]
+
+# Public name -> submodule. Submodules are imported on first attribute access
+# instead of at package import, so loading one toolset doesn't load them all.
+_MODULE_NAMES = {
+    "auth": ["ping", "login", "logout", "session_status"],
+    "project": ["list_projects", "list_all_projects", "get_project", "get_project_by_slug",
+                "create_project", "update_project", "delete_project"],
+    "story": ["list_user_stories", "create_user_story", "get_user_story", "update_user_story",
+              "delete_user_story", "assign_user_story_to_user", "unassign_user_story_from_user",
+              "get_user_story_statuses"],
+    "task": ["list_tasks", "create_task", "get_task", "update_task", "delete_task",
+             "assign_task_to_user", "unassign_task_from_user", "search_users",
+             "assign_task_by_username", "bulk_assign_tasks_by_username", "bulk_search_users",
+             "get_task_activity", "add_task_tags"],
+    "issue": ["list_issues", "create_issue", "bulk_create_issues", "get_issue", "update_issue",
+              "delete_issue", "assign_issue_to_user", "unassign_issue_from_user", "get_issue_statuses",
+              "get_issue_priorities", "get_issue_severities", "get_issue_types", "get_issue_metadata"],
+    "epic": ["list_epics", "create_epic", "get_epic", "update_epic", "delete_epic",
+             "assign_epic_to_user", "unassign_epic_from_user"],
+    "milestone": ["list_milestones", "create_milestone", "get_milestone", "update_milestone",
+                  "delete_milestone"],
+    "user": ["get_project_members", "invite_project_user", "refresh_project_members"],
+    "wiki": ["list_wiki_pages", "get_wiki_page"],
+    "batch": ["batch_execute"],
+}
+
+_NAME_TO_MODULE = {
+    name: module for module, names in _MODULE_NAMES.items()
+    for name in names + [f"register_{module}_tools"]
+}
+
+
+def __getattr__(name):
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_NAME_TO_MODULE))
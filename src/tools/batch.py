@@ -0,0 +1,105 @@
+# batch.py
+"""
+Batch execution tool for Taiga MCP bridge.
+
+Lets a client run several tool calls in one MCP round-trip. Sub-calls run
+concurrently and share the caller's authenticated session.
+"""
+
+import inspect
+from functools import partial
+from typing import List, Dict, Any
+
+import anyio
+from mcp.server.fastmcp import FastMCP
+
+from .common import get_authenticated_client, log_operation, logger
+
+BATCH_TOOL_NAME = "batch_execute"
+
+
+def register_batch_tools(mcp: FastMCP) -> None:
+    """Register the batch execution tool with the FastMCP instance."""
+
+    async def _run_call(session_id: str, call: Dict[str, Any], timeout_ms: int = None) -> Dict[str, Any]:
+        """Runs a single sub-call and returns its result envelope (never raises)."""
+        tool_name = call.get("tool")
+        if tool_name == BATCH_TOOL_NAME:
+            return {"tool": tool_name, "status": "error", "error": "Nested batch_execute calls are not allowed."}
+        # FastMCP's tool manager is the registry of everything registered so far
+        tool = mcp._tool_manager.get_tool(tool_name) if tool_name else None
+        if tool is None:
+            return {"tool": tool_name, "status": "error", "error": f"Unknown tool: {tool_name!r}"}
+
+        args = dict(call.get("args") or {})
+        if "session_id" in inspect.signature(tool.fn).parameters:
+            args.setdefault("session_id", session_id)
+
+        try:
+            # Validate arguments exactly as a direct MCP call would
+            metadata = tool.fn_metadata
+            kwargs = metadata.arg_model.model_validate(
+                metadata.pre_parse_json(args)).model_dump_one_level()
+            with anyio.fail_after(timeout_ms / 1000 if timeout_ms else None):
+                if tool.is_async:
+                    result = await tool.fn(**kwargs)
+                else:
+                    # Timed-out worker threads are abandoned; their result is discarded
+                    result = await anyio.to_thread.run_sync(
+                        partial(tool.fn, **kwargs), abandon_on_cancel=True)
+            return {"tool": tool_name, "status": "success", "result": result}
+        except TimeoutError:
+            logger.warning("Batch sub-call '%s' timed out after %sms", tool_name, timeout_ms)
+            return {"tool": tool_name, "status": "timeout", "error": f"Timed out after {timeout_ms}ms"}
+        except Exception as e:
+            logger.warning("Batch sub-call '%s' failed: %s", tool_name, e)
+            return {"tool": tool_name, "status": "error", "error": str(e)}
+
+    @mcp.tool(BATCH_TOOL_NAME, description="Executes several tool calls concurrently in one request. Each call is {'tool': name, 'args': {...}}; session_id is filled in automatically.")
+    async def batch_execute(session_id: str, calls: List[Dict[str, Any]], max_concurrent: int = 4,
+                            timeout_ms: int = None, stop_on_error: bool = False) -> Dict[str, Any]:
+        """
+        Runs multiple tool calls concurrently against the same session.
+
+        Args:
+            session_id: User session ID, shared by all sub-calls
+            calls: List of {"tool": <tool name>, "args": {<tool arguments>}}
+            max_concurrent: Maximum number of sub-calls running at once
+            timeout_ms: Optional per-call timeout in milliseconds
+            stop_on_error: Skip sub-calls that haven't started once one fails
+
+        Returns:
+            Dict with per-call results in request order and success/error counts
+        """
+        log_operation("execute", "batch", session_id, "%s calls (max_concurrent=%s)", len(calls), max_concurrent)
+        # Fail fast on a bad session instead of once per sub-call
+        get_authenticated_client(session_id)
+
+        limiter = anyio.CapacityLimiter(max(1, max_concurrent))
+        results: List[Dict[str, Any]] = [
+            {"tool": call.get("tool"), "status": "skipped"} for call in calls]
+
+        stopped = False
+
+        async with anyio.create_task_group() as tg:
+            async def _worker(index: int, call: Dict[str, Any]) -> None:
+                nonlocal stopped
+                async with limiter:
+                    # Calls already running are left to finish (they may be
+                    # writes); only ones not yet started are skipped
+                    if stopped:
+                        return
+                    results[index] = await _run_call(session_id, call, timeout_ms)
+                if stop_on_error and results[index]["status"] != "success":
+                    stopped = True
+
+            for index, call in enumerate(calls):
+                tg.start_soon(_worker, index, call)
+
+        succeeded = sum(1 for result in results if result["status"] == "success")
+        logger.info("Batch finished: %s/%s calls succeeded.", succeeded, len(calls))
+        return {
+            "results": results,
+            "succeeded": succeeded,
+            "failed": len(calls) - succeeded,
+        }
@@ -0,0 +1,92 @@
+# cache.py
+"""
+In-process caches shared by the Taiga MCP tool modules.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded mapping whose entries expire `ttl` seconds after
+    they were stored. When full, the least recently used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float,
+                 on_evict: Optional[Callable[[Hashable, Any], None]] = None):
+        if maxsize <= 0:
+            raise ValueError("TTLCache maxsize must be positive.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Called (outside the lock) with each entry the cache drops on its own,
+        # i.e. on expiry or when full; not for pop() or clear()
+        self.on_evict = on_evict
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if time.monotonic() < expires_at:
+                self._data.move_to_end(key)
+                return value
+            del self._data[key]
+        self._evicted([(key, value)])
+        return default
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Stores value under key, expiring after ttl seconds (default: the cache's ttl)."""
+        evicted = []
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                old_key, (old_value, _) = self._data.popitem(last=False)
+                evicted.append((old_key, old_value))
+        self._evicted(evicted)
+
+    def _evicted(self, entries: List[Tuple[Hashable, Any]]) -> None:
+        if self.on_evict is None:
+            return
+        for key, value in entries:
+            self.on_evict(key, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Removes key and returns its value, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None or time.monotonic() >= entry[1]:
+                return default
+            return entry[0]
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Removes every entry whose key matches predicate; returns how many."""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_MISSING = object()
@@ -3,16 +3,274 @@
 Common utilities and shared code for Taiga MCP tools.
 """
 
+import functools
+import hashlib
 import logging
-from typing import Dict, Any
+import os
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from contextvars import ContextVar, copy_context
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, NoReturn, Optional, Tuple, TypeVar
+import anyio
+import httpx
+from mcp.server.fastmcp import FastMCP
+from requests.adapters import HTTPAdapter
 from pytaigaclient.exceptions import TaigaException
 from src.taiga_client import TaigaClientWrapper
+from .cache import TTLCache
+
+T = TypeVar("T")
 
 # Get logger for all tool modules
 logger = logging.getLogger(__name__)
 
-# Store active sessions: session_id -> TaigaClientWrapper instance
-active_sessions: Dict[str, TaigaClientWrapper] = {}
+# (connect, read) timeouts in seconds for every outgoing Taiga request, so an
+# unresponsive host fails fast instead of holding a worker.
+CONNECT_TIMEOUT = float(os.getenv("TAIGA_CONNECT_TIMEOUT", "3"))
+READ_TIMEOUT = float(os.getenv("TAIGA_READ_TIMEOUT", "7"))
+
+# Cap on concurrent Taiga requests across all sessions, and optional pacing in
+# requests/second (0 = off), so bursts of tool calls don't trip Taiga's
+# throttling. Throttled (429) requests are retried with backoff.
+MAX_INFLIGHT = int(os.getenv("TAIGA_MAX_INFLIGHT", "20"))
+RATE_LIMIT = float(os.getenv("TAIGA_RATE_LIMIT", "0"))
+
+# Keep-alive connections kept per Taiga host in the shared pool (see _http_adapter).
+POOL_MAXSIZE = int(os.getenv("TAIGA_POOL_MAXSIZE", "20"))
+if POOL_MAXSIZE < 1:
+    raise ValueError(f"TAIGA_POOL_MAXSIZE must be at least 1, got {POOL_MAXSIZE}")
+
+# Worker threads shared by sync tools that fan out blocking Taiga calls
+# (see map_in_threads), so each call doesn't start and tear down its own pool.
+IO_WORKERS = int(os.getenv("TAIGA_IO_WORKERS", "8"))
+_IO_POOL = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="taiga-io")
+
+
+class _TokenBucket:
+    """Blocking token bucket allowing `rate` acquisitions per second (bursts up to `rate`)."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = max(1.0, rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(max(1.0, self.rate), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token; a negative balance is the time to wait for it
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+class _TaigaHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter for Taiga requests: applies a default timeout to requests sent
+    without one, caps concurrent requests and optionally paces them. Throttled
+    (429) requests are retried with backoff, waiting outside the in-flight cap
+    and taking a fresh pacing token per attempt.
+    """
+
+    # Longest wait honoured from a Retry-After header, in seconds
+    RETRY_AFTER_MAX = 10.0
+
+    def __init__(self, *args, timeout=None, max_inflight: int = 0, rate: float = 0,
+                 throttle_retries: int = 3, backoff_factor: float = 0.5, backoff_jitter: float = 0.25,
+                 **kwargs):
+        self.timeout = timeout
+        self._inflight = threading.BoundedSemaphore(max_inflight) if max_inflight > 0 else nullcontext()
+        self._bucket = _TokenBucket(rate) if rate > 0 else None
+        self.throttle_retries = throttle_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_jitter = backoff_jitter
+        super().__init__(*args, **kwargs)
+
+    def _throttle_delay(self, response, attempt: int) -> float:
+        """Seconds to wait before retrying a 429: Retry-After (capped) or exponential backoff."""
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.strip().isdigit():
+            return min(float(retry_after), self.RETRY_AFTER_MAX)
+        return self.backoff_factor * (2 ** attempt) + random.uniform(0, self.backoff_jitter)
+
+    def send(self, request, timeout=None, **kwargs):
+        timeout = self.timeout if timeout is None else timeout
+        attempt = 0
+        while True:
+            if self._bucket is not None:
+                self._bucket.acquire()
+            with self._inflight:
+                response = super().send(request, timeout=timeout, **kwargs)
+            # 429s were not processed, so retrying is safe for any method
+            if response.status_code != 429 or attempt >= self.throttle_retries:
+                return response
+            delay = self._throttle_delay(response, attempt)
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+
+# Shared connection pool for every outgoing Taiga request. Each client keeps its
+# own requests.Session (auth headers are per user) but mounts this adapter, so
+# concurrent sessions against the same host reuse keep-alive connections.
+_http_adapter = _TaigaHTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=POOL_MAXSIZE,
+    pool_block=False,
+    timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+    max_inflight=MAX_INFLIGHT,
+    rate=RATE_LIMIT,
+)
+
+# Shared async HTTP client for unauthenticated calls (e.g. ping), so they can
+# run on the event loop without blocking other tool calls.
+_async_http = httpx.AsyncClient(
+    timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT), follow_redirects=True
+)
+
+# Default page size for paginated Taiga list calls (see iter_pages)
+PAGE_SIZE = 100
+
+# Store active sessions: session_id -> TaigaClientWrapper instance.
+# Bounded and expiring (default 8h, roughly a Taiga token lifetime) so abandoned
+# sessions don't accumulate; safe to share across concurrent tool calls.
+SESSION_TTL = float(os.getenv("TAIGA_SESSION_TTL", str(8 * 3600)))
+MAX_SESSIONS = int(os.getenv("TAIGA_MAX_SESSIONS", "10000"))
+active_sessions = TTLCache(maxsize=MAX_SESSIONS, ttl=SESSION_TTL,
+                           on_evict=lambda session_id, wrapper: _release_session_client(session_id))
+
+# Sessions holding the same token (same user logged in from several MCP
+# clients) share one wrapper: (host, token digest) -> [wrapper, session count],
+# and session_id -> that key. A wrapper is closed when its last session goes.
+_shared_clients: Dict[Tuple[str, bytes], list] = {}
+_session_client_keys: Dict[str, Tuple[str, bytes]] = {}
+_shared_clients_lock = threading.Lock()
+
+# Session ID of the tool call being handled, so error handlers can drop a session
+# whose token Taiga rejects. Worker threads (see threaded_tool) inherit it.
+_current_session: ContextVar[Optional[str]] = ContextVar("taiga_current_session", default=None)
+
+# Last seen entity snapshots: (session_id, resource, entity_id) -> entity dict.
+# Lets update tools skip the GET-for-version round-trip on repeated edits and
+# recognise no-op updates without calling Taiga.
+ENTITY_CACHE_TTL = 60.0
+_entity_cache = TTLCache(maxsize=4096, ttl=ENTITY_CACHE_TTL)
+
+# Per-session lookup data that rarely changes (issue statuses/priorities/...,
+# the project list): (session_id, project_id, resource) -> API result.
+META_CACHE_TTL = 300.0
+_meta_cache = TTLCache(maxsize=2048, ttl=META_CACHE_TTL)
+
+# Short-lived results of list calls: (endpoint, session_id, ...) -> API result.
+# Absorbs repeated identical reads within an agent turn; the tools' own writes
+# invalidate the endpoint for the session (see invalidate_cached_calls).
+LIST_CACHE_TTL = 10.0
+_list_cache = TTLCache(maxsize=1024, ttl=LIST_CACHE_TTL)
+_NOT_CACHED = object()
+
+# Project memberships, shared by get_project_members and search_users (and so
+# by every assign-by-username); kept a little longer than other list results.
+MEMBERS_CACHE_TTL = 30.0
+
+
+def get_async_http() -> httpx.AsyncClient:
+    """Returns the shared async HTTP client used for unauthenticated requests."""
+    return _async_http
+
+
+class _RandomPool:
+    """
+    Serves random bytes from a buffer refilled with os.urandom, so issuing a
+    session ID costs one syscall per refill instead of one per login.
+    """
+
+    def __init__(self, size: int = 4096):
+        self._size = size
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._offset = 0
+
+    def reset(self) -> None:
+        """Discards buffered bytes (used after fork so children never share them)."""
+        with self._lock:
+            self._buffer = b""
+            self._offset = 0
+
+    def take(self, n: int) -> bytes:
+        with self._lock:
+            if self._offset + n > len(self._buffer):
+                self._buffer = os.urandom(max(self._size, n))
+                self._offset = 0
+            chunk = self._buffer[self._offset:self._offset + n]
+            self._offset += n
+            return chunk
+
+    def uuid(self) -> uuid.UUID:
+        return uuid.UUID(bytes=self.take(16), version=4)
+
+
+_random_pool = _RandomPool()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_random_pool.reset)
+
+
+def new_session_id() -> str:
+    """Returns a new random (UUID4) session ID."""
+    return str(_random_pool.uuid())
+
+
+def get_http_adapter() -> HTTPAdapter:
+    """Returns the shared connection pool adapter for Taiga clients."""
+    return _http_adapter
+
+
+def add_session(session_id: str, wrapper: TaigaClientWrapper) -> None:
+    """
+    Stores a freshly authenticated wrapper for session_id. If a live session
+    already has a wrapper for the same host and token, that one is shared and
+    the new one is closed.
+    """
+    token_digest = hashlib.blake2b(str(wrapper.api.auth_token).encode(), digest_size=16).digest()
+    key = (wrapper.host, token_digest)
+    with _shared_clients_lock:
+        entry = _shared_clients.setdefault(key, [wrapper, 0])
+        entry[1] += 1
+        _session_client_keys[session_id] = key
+        shared = entry[0]
+    if shared is not wrapper:
+        wrapper.close()
+    active_sessions[session_id] = shared
+
+
+def remove_session(session_id: str) -> Optional[TaigaClientWrapper]:
+    """
+    Drops a session and returns its wrapper, or None if it was not active.
+    The wrapper is closed unless another session still shares it.
+    """
+    wrapper = active_sessions.pop(session_id, None)
+    _release_session_client(session_id)
+    return wrapper
+
+
+def _release_session_client(session_id: str) -> None:
+    """Releases the session's share of its wrapper, closing it if it was the last."""
+    with _shared_clients_lock:
+        key = _session_client_keys.pop(session_id, None)
+        entry = _shared_clients.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _shared_clients[key]
+    entry[0].close()
 
 
 def get_authenticated_client(session_id: str) -> TaigaClientWrapper:
@@ -23,43 +281,320 @@ def get_authenticated_client(session_id: str) -> TaigaClientWrapper:
     client = active_sessions.get(session_id)
     # Also check if the client object itself exists and is authenticated
     if not client or not client.is_authenticated:
-        logger.warning(f"Invalid or expired session ID provided: {session_id}")
+        logger.warning("Invalid or expired session ID provided: %s", session_id)
         # Raise PermissionError - FastMCP will map this to an appropriate error response
         raise PermissionError(
             f"Invalid or expired session ID: '{session_id}'. Please login again.")
-    logger.debug(f"Retrieved valid client for session ID: {session_id}")
+    logger.debug("Retrieved valid client for session ID: %s", session_id)
+    _current_session.set(session_id)
     return client
 
 
-def handle_taiga_exception(operation: str, entity_type: str, entity_id: Any, e: TaigaException) -> None:
+def invalidate_client(session_id: str) -> None:
+    """
+    Drops a session whose credentials Taiga no longer accepts, so the next call
+    fails fast with a 'please login again' error instead of another 401.
+    Sessions sharing the same token are dropped too, since Taiga rejects it for all of them.
+    """
+    with _shared_clients_lock:
+        key = _session_client_keys.get(session_id)
+        session_ids = [sid for sid, k in _session_client_keys.items() if key is not None and k == key]
+    for sid in session_ids or [session_id]:
+        if remove_session(sid) is not None:
+            logger.warning("Session %s rejected by Taiga; removed, please login again.", sid[:8])
+
+
+def get_cached_entity(session_id: str, resource: str, entity_id: int) -> Optional[dict]:
+    """
+    Returns the last seen snapshot of an entity, or None if unknown or expired.
+    """
+    return _entity_cache.get((session_id, resource, entity_id))
+
+
+def get_cached_version(session_id: str, resource: str, entity_id: int) -> Optional[int]:
+    """
+    Returns the cached version of an entity, or None if unknown or expired.
+    """
+    entity = get_cached_entity(session_id, resource, entity_id)
+    return entity.get('version') if entity else None
+
+
+def remember_entity(session_id: str, resource: str, entity_id: int, entity: Any) -> None:
+    """
+    Caches an entity returned from the Taiga API, if it carries a version.
+    """
+    if isinstance(entity, dict) and entity.get('version'):
+        _entity_cache[(session_id, resource, entity_id)] = entity
+
+
+def forget_entity(session_id: str, resource: str, entity_id: int) -> None:
+    """
+    Drops the cached snapshot of an entity (e.g. after deletion or a conflict).
+    """
+    _entity_cache.pop((session_id, resource, entity_id), None)
+
+
+def cached_project_meta(session_id: str, project_id: Optional[int], resource: str, fetch: Callable[[], T]) -> T:
+    """
+    Returns cached lookup data for a project (project_id None for session-wide
+    data such as the project list), calling fetch() on a miss or after expiry.
+    """
+    key = (session_id, project_id, resource)
+    value = _meta_cache.get(key)
+    if value is None:
+        value = fetch()
+        _meta_cache[key] = value
+    return value
+
+
+def cached_call(key: Hashable, ttl: float, fn: Callable[[], T]) -> T:
+    """
+    Returns the cached result of fn() for key, calling it on a miss or once the
+    entry is older than ttl seconds. Keys start with (endpoint, session_id) so
+    writes can invalidate them; unhashable keys (e.g. list filters) bypass the cache.
+    """
+    try:
+        value = _list_cache.get(key, _NOT_CACHED)
+    except TypeError:
+        return fn()
+    if value is _NOT_CACHED:
+        value = fn()
+        _list_cache.set(key, value, ttl=ttl)
+    return value
+
+
+def invalidate_cached_calls(endpoint: str, session_id: str) -> None:
+    """Drops the session's cached results for an endpoint after a write through it."""
+    _list_cache.discard_where(lambda key: key[:2] == (endpoint, session_id))
+
+
+def list_project_members(session_id: str, project_id: int) -> List[dict]:
+    """
+    Returns a project's memberships, cached per session for MEMBERS_CACHE_TTL
+    seconds. Invalidate with invalidate_cached_calls("memberships", session_id).
+    """
+    taiga_client_wrapper = get_authenticated_client(session_id)
+    query_params = {"project": project_id}
+    return cached_call(
+        ("memberships", session_id, tuple(sorted(query_params.items()))), MEMBERS_CACHE_TTL,
+        lambda: taiga_client_wrapper.api.memberships.list(query_params=query_params))
+
+
+def invalidate_project_meta(session_id: str, project_id: Optional[int]) -> None:
+    """
+    Drops the session's cached lookups for a project, along with its cached
+    project list.
+    """
+    _meta_cache.discard_where(lambda key: key[0] == session_id and key[1] in (project_id, None))
+
+
+def iter_pages(list_page: Callable[[dict], List[T]], query_params: dict,
+               page_size: int = PAGE_SIZE) -> Iterator[List[T]]:
+    """
+    Yields successive pages of a paginated Taiga list endpoint, calling
+    list_page(query_params) with page/page_size added. Stops after a short
+    page, or after an oversized one (the server ignored pagination and
+    returned everything).
+    """
+    page = 1
+    while True:
+        try:
+            items = list_page(query_params | {"page": page, "page_size": page_size})
+        except TaigaException as e:
+            # Taiga answers 404 for a page past the end (last page was full)
+            if page > 1 and getattr(e, "status_code", None) == 404:
+                return
+            raise
+        yield items
+        if len(items) != page_size:
+            return
+        page += 1
+
+
+def list_up_to(list_page: Callable[[dict], List[T]], query_params: dict, limit: int) -> List[T]:
+    """
+    Returns at most limit items of a paginated Taiga list endpoint (see
+    iter_pages), fetching only as many pages as needed to fill it.
+    """
+    items: List[T] = []
+    for page in iter_pages(list_page, query_params, page_size=max(1, min(limit, PAGE_SIZE))):
+        items.extend(page[:limit - len(items)])
+        if len(items) >= limit:
+            break
+    return items
+
+
+def _is_version_conflict(e: TaigaException) -> bool:
+    """
+    True if Taiga rejected an edit for a stale version: its optimistic
+    concurrency check answers 400 with a 'version' error (409 from proxies/newer APIs).
+    """
+    status_code = getattr(e, "status_code", None)
+    return status_code == 409 or (status_code == 400 and "version" in str(e).lower())
+
+
+def edit_with_version(session_id: str, resource: str, entity_type: str, entity_id: int,
+                      fetch: Callable[[int], dict], edit: Callable[[int], T],
+                      version: Optional[int] = None) -> T:
+    """
+    Applies an edit that needs the entity's current version. A version passed
+    by the caller is used as is (a conflict is raised to the caller). Otherwise
+    tries the cached version first (one round-trip); if Taiga rejects it as
+    stale (edited elsewhere), or none is cached, fetches the entity for a fresh
+    version and edits once more. Other errors are raised straight away. The edited entity is cached for the next update.
+    """
+    if version is not None:
+        updated = edit(version)
+        remember_entity(session_id, resource, entity_id, updated)
+        return updated
+
+    updated = None
+    cached_version = get_cached_version(session_id, resource, entity_id)
+    if cached_version:
+        try:
+            updated = edit(cached_version)
+        except TaigaException as e:
+            # Anything but a stale version (auth, not found, validation, 5xx)
+            # would fail the same way again
+            if not _is_version_conflict(e):
+                raise
+            logger.info("Cached version rejected for %s %s, refetching.", entity_type, entity_id)
+            forget_entity(session_id, resource, entity_id)
+
+    if updated is None:
+        current = fetch(entity_id)
+        version = current.get('version')
+        if not version:
+            raise ValueError(f"Could not determine version for {entity_type} {entity_id}")
+        updated = edit(version)
+    remember_entity(session_id, resource, entity_id, updated)
+    return updated
+
+
+def handle_taiga_exception(operation: str, entity_type: str, entity_id: Any, e: TaigaException) -> NoReturn:
     """
     Standard error handling for TaigaException across all tool modules.
+    Must be called from an except block; re-raises the active exception.
     """
-    logger.error(f"Taiga API error {operation} {entity_type} {entity_id}: {e}", exc_info=False)
-    raise e
+    logger.error("Taiga API error %s %s %s: %s", operation, entity_type, entity_id, e, exc_info=False)
+    if getattr(e, "status_code", None) == 401:
+        session_id = _current_session.get()
+        if session_id:
+            invalidate_client(session_id)
+    raise
 
 
-def handle_general_exception(operation: str, entity_type: str, entity_id: Any, e: Exception) -> None:
+def handle_general_exception(operation: str, entity_type: str, entity_id: Any, e: Exception) -> NoReturn:
     """
     Standard error handling for general exceptions across all tool modules.
     """
-    logger.error(f"Unexpected error {operation} {entity_type} {entity_id}: {e}", exc_info=True)
-    raise RuntimeError(f"Server error {operation} {entity_type}: {e}")
+    logger.error("Unexpected error %s %s %s: %s", operation, entity_type, entity_id, e, exc_info=True)
+    raise RuntimeError(f"Server error {operation} {entity_type}: {e}") from e
+
+
+def taiga_call(operation: str, entity_type: str, entity_id: Any, fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Runs fn(*args, **kwargs) with the standard Taiga error handling used by all tools.
+    """
+    try:
+        return fn(*args, **kwargs)
+    except TaigaException as e:
+        handle_taiga_exception(operation, entity_type, entity_id, e)
+    except Exception as e:
+        handle_general_exception(operation, entity_type, entity_id, e)
+
+
+def threaded_tool(mcp: FastMCP, name: str, description: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Registers a blocking tool function as an async MCP tool that runs in a worker
+    thread, so slow Taiga round-trips don't stall the event loop (and every other
+    in-flight tool call). Returns the original function, so tools can still call
+    each other synchronously.
+    """
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(fn)
+        async def run_in_thread(*args, **kwargs) -> T:
+            return await anyio.to_thread.run_sync(
+                functools.partial(fn, *args, **kwargs), abandon_on_cancel=True)
+
+        mcp.tool(name, description=description)(run_in_thread)
+        return fn
+    return decorator
+
+
+def map_in_threads(fn: Callable[[Any], T], items: Iterable[Any]) -> List[T]:
+    """
+    Calls fn on each item in the shared I/O pool and returns the results in
+    order, raising the first error. Each call runs in a copy of the caller's
+    context (so the current session is known). Not for use from pool workers.
+    """
+    context = copy_context()
+    return list(_IO_POOL.map(lambda item: context.copy().run(fn, item), items))
+
+
+async def gather_in_threads(calls: Iterable[Callable[[], Any]],
+                            limiter: Optional[anyio.CapacityLimiter] = None) -> List[Any]:
+    """
+    Runs blocking callables concurrently in worker threads and returns their
+    results in order. If any call fails, the first error is raised once all
+    calls have finished (like asyncio.gather, without an exception group).
+    """
+    calls = list(calls)
+    results: List[Any] = [None] * len(calls)
+    errors: List[BaseException] = []
+
+    async def _run(index: int, call: Callable[[], Any]) -> None:
+        try:
+            results[index] = await anyio.to_thread.run_sync(call, limiter=limiter)
+        except Exception as e:
+            errors.append(e)
+
+    async with anyio.create_task_group() as tg:
+        for index, call in enumerate(calls):
+            tg.start_soon(_run, index, call)
+    if errors:
+        raise errors[0]
+    return results
+
+
+class _SessionLoggerAdapter(logging.LoggerAdapter):
+    """Tags messages with the shortened session ID (also set as the record's `sid`)."""
+
+    def process(self, msg, kwargs):
+        msg, kwargs = super().process(msg, kwargs)
+        return f"{msg} (session {self.extra['sid']})", kwargs
+
+
+@functools.lru_cache(maxsize=512)
+def get_session_logger(session_id: str) -> logging.LoggerAdapter:
+    """
+    Returns the tool logger bound to a session, built once per session ID.
+    """
+    session_short = session_id[:8] if session_id else "unknown"
+    return _SessionLoggerAdapter(logger, {"sid": session_short})
 
 
-def log_operation(operation: str, entity_type: str, session_id: str, extra_info: str = "") -> None:
+def log_operation(operation: str, entity_type: str, session_id: str, extra_info: str = "", *args: Any) -> None:
     """
     Standard operation logging across all tool modules.
+    If args are given, extra_info is a %-format string that is only rendered
+    when INFO logging is enabled.
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     session_short = session_id[:8] if session_id else "unknown"
+    if args:
+        extra_info = extra_info % args
     info_str = f" {extra_info}" if extra_info else ""
-    logger.info(f"Executing {operation}_{entity_type}{info_str} for session {session_short}...")
+    logger.info("Executing %s_%s%s for session %s...", operation, entity_type, info_str, session_short)
 
 
 def log_success(operation: str, entity_type: str, entity_id: Any, entity_name: str = "") -> None:
     """
     Standard success logging across all tool modules.
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     name_str = f" '{entity_name}'" if entity_name else ""
     id_str = f" (ID: {entity_id})" if entity_id else ""
-    logger.info(f"{entity_type.title()}{name_str} {operation} successful{id_str}.")
+    logger.info("%s%s %s successful%s.", entity_type.title(), name_str, operation, id_str)
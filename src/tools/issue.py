@@ -3,42 +3,78 @@
 Issue management tools for Taiga MCP bridge.
 """
 
+from functools import partial
 from typing import List, Dict, Any
+import anyio
 from mcp.server.fastmcp import FastMCP
 from pytaigaclient.exceptions import TaigaException
 
 from .common import (
     get_authenticated_client, 
+    edit_with_version,
+    cached_project_meta,
+    gather_in_threads,
+    list_up_to,
+    remember_entity,
+    forget_entity,
     handle_taiga_exception,
     handle_general_exception,
     log_operation,
     log_success,
+    get_session_logger,
+    taiga_call,
+    threaded_tool,
     logger
 )
 
+# Fields every bulk_create_issues item must provide (create_issue's required args)
+BULK_ISSUE_REQUIRED_FIELDS = ("subject", "priority_id", "status_id", "severity_id", "type_id")
+
+# get_issue_metadata result key -> pytaigaclient resource
+ISSUE_METADATA_RESOURCES = {
+    "statuses": "issue_statuses",
+    "priorities": "issue_priorities",
+    "severities": "issue_severities",
+    "types": "issue_types",
+}
+
+
+def _list_issue_metadata(taiga_client_wrapper, session_id: str, project_id: int, resource: str) -> List[Dict[str, Any]]:
+    """Lists an issue lookup resource (e.g. issue_statuses) for a project, cached per session."""
+    return cached_project_meta(
+        session_id, project_id, resource,
+        lambda: getattr(taiga_client_wrapper.api, resource).list(query_params={"project_id": project_id}))
+
 
 def register_issue_tools(mcp: FastMCP) -> None:
     """Register issue management tools with the FastMCP instance."""
 
-    @mcp.tool("list_issues", description="Lists issues within a specific project, optionally filtered.")
-    def list_issues(session_id: str, project_id: int, **filters) -> List[Dict[str, Any]]:
-        """Lists issues for a project. Optional filters like 'milestone', 'status', 'priority', 'severity', 'type', 'assigned_to' can be passed as kwargs."""
-        log_operation("list", "issues", session_id, f"for project {project_id}, filters: {filters}")
+    @threaded_tool(mcp, "list_issues", description="Lists issues within a specific project, optionally filtered. Set limit to fetch at most that many issues, page by page.")
+    def list_issues(session_id: str, project_id: int, limit: int = None, **filters) -> List[Dict[str, Any]]:
+        """Lists issues for a project. Optional filters like 'milestone', 'status', 'priority', 'severity', 'type', 'assigned_to' can be passed as kwargs. Optional limit caps the number of issues returned."""
+        log_operation("list", "issues", session_id, "for project %s, filters: %s, limit: %s", project_id, filters, limit)
         taiga_client_wrapper = get_authenticated_client(session_id)
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be a positive number.")
         try:
             # Fix: Pass filters as query_params dictionary with project included
-            query_params = {"project": project_id, **filters}
-            issues = taiga_client_wrapper.api.issues.list(query_params=query_params)
-            return issues
+            query_params = {"project": project_id} | filters
+            if limit is None:
+                issues = taiga_client_wrapper.api.issues.list(query_params=query_params)
+                return issues
+
+            # Only fetch as many pages as needed to fill the limit
+            return list_up_to(lambda params: taiga_client_wrapper.api.issues.list(query_params=params),
+                              query_params, limit)
         except TaigaException as e:
             handle_taiga_exception("listing", "issues", f"project {project_id}", e)
         except Exception as e:
             handle_general_exception("listing", "issues", f"project {project_id}", e)
 
-    @mcp.tool("create_issue", description="Creates a new issue within a project.")
+    @threaded_tool(mcp, "create_issue", description="Creates a new issue within a project.")
     def create_issue(session_id: str, project_id: int, subject: str, priority_id: int, status_id: int, severity_id: int, type_id: int, **kwargs) -> Dict[str, Any]:
         """Creates an issue. Requires project_id, subject, priority_id, status_id, severity_id, type_id. Optional fields (description, assigned_to_id, etc.) via kwargs."""
-        log_operation("create", "issue", session_id, f"'{subject}' in project {project_id}")
+        log_operation("create", "issue", session_id, "'%s' in project %s", subject, project_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         if not subject:
             raise ValueError("Issue subject cannot be empty.")
@@ -49,13 +85,13 @@ def register_issue_tools(mcp: FastMCP) -> None:
                 "status": status_id,
                 "severity": severity_id,
                 "type": type_id,
-                **kwargs
-            }
+            } | kwargs
             issue = taiga_client_wrapper.api.issues.create(
                 project=project_id,
                 subject=subject,
                 data=data
             )
+            remember_entity(session_id, "issues", issue.get('id'), issue)
             log_success("created", "issue", issue.get('id', 'N/A'), subject)
             return issue
         except TaigaException as e:
@@ -63,56 +99,101 @@ def register_issue_tools(mcp: FastMCP) -> None:
         except Exception as e:
             handle_general_exception("creating", "issue", subject, e)
 
-    @mcp.tool("get_issue", description="Gets detailed information about a specific issue by its ID.")
+    @mcp.tool("bulk_create_issues", description="Creates several issues within a project concurrently. Each item takes create_issue's fields (subject, priority_id, status_id, severity_id, type_id, optional extras); failures are reported per item.")
+    async def bulk_create_issues(session_id: str, project_id: int, issues: List[Dict[str, Any]], max_concurrent: int = 8) -> Dict[str, Any]:
+        """
+        Creates multiple issues in one call.
+
+        Args:
+            session_id: User session ID
+            project_id: Project to create the issues in
+            issues: List of create_issue field dicts, one per issue
+            max_concurrent: Maximum number of creates in flight at once
+
+        Returns:
+            Dict with per-issue results in request order and created/failed counts
+        """
+        log_operation("bulk_create", "issues", session_id, "%s issues in project %s", len(issues), project_id)
+        # Fail fast on a bad session instead of once per issue
+        get_authenticated_client(session_id)
+
+        limiter = anyio.CapacityLimiter(max(1, max_concurrent))
+        results: List[Dict[str, Any]] = [{} for _ in issues]
+
+        async def _create(index: int, item: Dict[str, Any]) -> None:
+            missing = [field for field in BULK_ISSUE_REQUIRED_FIELDS if field not in item]
+            if missing:
+                results[index] = {"status": "error", "subject": item.get("subject"),
+                                  "error": f"Missing required fields: {', '.join(missing)}"}
+                return
+            try:
+                issue = await anyio.to_thread.run_sync(
+                    partial(create_issue, session_id, project_id, **item), limiter=limiter)
+                results[index] = {"status": "success", "issue": issue}
+            except Exception as e:
+                # One bad item must not cancel the rest of the import
+                results[index] = {"status": "error", "subject": item.get("subject"), "error": str(e)}
+
+        async with anyio.create_task_group() as tg:
+            for index, item in enumerate(issues):
+                tg.start_soon(_create, index, item)
+
+        created = sum(1 for result in results if result["status"] == "success")
+        logger.info("Bulk create finished: %s/%s issues created.", created, len(issues))
+        return {
+            "results": results,
+            "created": created,
+            "failed": len(issues) - created,
+        }
+
+    @threaded_tool(mcp, "get_issue", description="Gets detailed information about a specific issue by its ID.")
     def get_issue(session_id: str, issue_id: int) -> Dict[str, Any]:
         """Retrieves issue details by ID."""
-        log_operation("get", "issue", session_id, f"ID {issue_id}")
+        log_operation("get", "issue", session_id, "ID %s", issue_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
             issue = taiga_client_wrapper.api.issues.get(issue_id)
+            remember_entity(session_id, "issues", issue_id, issue)
             return issue
         except TaigaException as e:
             handle_taiga_exception("getting", "issue", issue_id, e)
         except Exception as e:
             handle_general_exception("getting", "issue", issue_id, e)
 
-    @mcp.tool("update_issue", description="Updates details of an existing issue.")
-    def update_issue(session_id: str, issue_id: int, **kwargs) -> Dict[str, Any]:
-        """Updates an issue. Pass fields to update as keyword arguments (e.g., subject, description, status_id, assigned_to)."""
-        log_operation("update", "issue", session_id, f"ID {issue_id} with data: {kwargs}")
+    @threaded_tool(mcp, "update_issue", description="Updates details of an existing issue. Pass the version from a previous get/update to skip looking it up.")
+    def update_issue(session_id: str, issue_id: int, version: int = None, **kwargs) -> Dict[str, Any]:
+        """Updates an issue. Pass fields to update as keyword arguments (e.g., subject, description, status_id, assigned_to). Optional version (the entity's current version) saves a lookup."""
+        log_operation("update", "issue", session_id, "ID %s (version %s) with data: %s", issue_id, version, kwargs)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
             if not kwargs:
-                 logger.info(f"No fields provided for update on issue {issue_id}")
+                 logger.info("No fields provided for update on issue %s", issue_id)
                  return taiga_client_wrapper.api.issues.get(issue_id)
 
-            # Get current issue data to retrieve version
-            current_issue = taiga_client_wrapper.api.issues.get(issue_id)
-            version = current_issue.get('version')
-            if not version:
-                raise ValueError(f"Could not determine version for issue {issue_id}")
-                
-            # Use edit method for partial updates with data dictionary
-            updated_issue = taiga_client_wrapper.api.issues.edit(
-                issue_id=issue_id,
-                version=version,
-                data=kwargs
-            )
-            logger.info(f"Issue {issue_id} update request sent.")
+            # Reuses the version cached from the last read/write when possible
+            updated_issue = edit_with_version(
+                session_id, "issues", "issue", issue_id, taiga_client_wrapper.api.issues.get,
+                lambda version: taiga_client_wrapper.api.issues.edit(
+                    issue_id=issue_id,
+                    version=version,
+                    data=kwargs
+                ),
+                version=version)
+            logger.info("Issue %s update request sent.", issue_id)
             return updated_issue
         except TaigaException as e:
             handle_taiga_exception("updating", "issue", issue_id, e)
         except Exception as e:
             handle_general_exception("updating", "issue", issue_id, e)
 
-    @mcp.tool("delete_issue", description="Deletes an issue by its ID.")
+    @threaded_tool(mcp, "delete_issue", description="Deletes an issue by its ID.")
     def delete_issue(session_id: str, issue_id: int) -> Dict[str, Any]:
         """Deletes an issue by ID."""
-        logger.warning(
-            f"Executing delete_issue ID {issue_id} for session {session_id[:8]}...")
+        get_session_logger(session_id).warning("Executing delete_issue ID %s", issue_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
             taiga_client_wrapper.api.issues.delete(issue_id)
+            forget_entity(session_id, "issues", issue_id)
             log_success("deleted", "issue", issue_id)
             return {"status": "deleted", "issue_id": issue_id}
         except TaigaException as e:
@@ -120,68 +201,80 @@ def register_issue_tools(mcp: FastMCP) -> None:
         except Exception as e:
             handle_general_exception("deleting", "issue", issue_id, e)
 
-    @mcp.tool("assign_issue_to_user", description="Assigns a specific issue to a specific user.")
+    @threaded_tool(mcp, "assign_issue_to_user", description="Assigns a specific issue to a specific user.")
     def assign_issue_to_user(session_id: str, issue_id: int, user_id: int) -> Dict[str, Any]:
         """Assigns an issue to a user."""
-        log_operation("assign", "issue_to_user", session_id, f"Issue {issue_id} -> User {user_id}")
+        log_operation("assign", "issue_to_user", session_id, "Issue %s -> User %s", issue_id, user_id)
         # Delegate to update_issue
         return update_issue(session_id, issue_id, assigned_to=user_id)
 
-    @mcp.tool("unassign_issue_from_user", description="Unassigns a specific issue (sets assigned user to null).")
+    @threaded_tool(mcp, "unassign_issue_from_user", description="Unassigns a specific issue (sets assigned user to null).")
     def unassign_issue_from_user(session_id: str, issue_id: int) -> Dict[str, Any]:
         """Unassigns an issue."""
-        log_operation("unassign", "issue_from_user", session_id, f"Issue {issue_id}")
+        log_operation("unassign", "issue_from_user", session_id, "Issue %s", issue_id)
         # Delegate to update_issue
         return update_issue(session_id, issue_id, assigned_to=None)
 
-    @mcp.tool("get_issue_statuses", description="Lists the available statuses for issues within a specific project.")
+    @threaded_tool(mcp, "get_issue_statuses", description="Lists the available statuses for issues within a specific project.")
     def get_issue_statuses(session_id: str, project_id: int) -> List[Dict[str, Any]]:
         """Retrieves the list of issue statuses for a project."""
-        log_operation("get", "issue_statuses", session_id, f"for project {project_id}")
+        log_operation("get", "issue_statuses", session_id, "for project %s", project_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
-            statuses = taiga_client_wrapper.api.issue_statuses.list(query_params={"project_id": project_id})
+            statuses = _list_issue_metadata(taiga_client_wrapper, session_id, project_id, "issue_statuses")
             return statuses
         except TaigaException as e:
             handle_taiga_exception("getting", "issue statuses", f"project {project_id}", e)
         except Exception as e:
             handle_general_exception("getting", "issue statuses", f"project {project_id}", e)
 
-    @mcp.tool("get_issue_priorities", description="Lists the available priorities for issues within a specific project.")
+    @threaded_tool(mcp, "get_issue_priorities", description="Lists the available priorities for issues within a specific project.")
     def get_issue_priorities(session_id: str, project_id: int) -> List[Dict[str, Any]]:
         """Retrieves the list of issue priorities for a project."""
-        log_operation("get", "issue_priorities", session_id, f"for project {project_id}")
+        log_operation("get", "issue_priorities", session_id, "for project %s", project_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
-            priorities = taiga_client_wrapper.api.issue_priorities.list(query_params={"project_id": project_id})
+            priorities = _list_issue_metadata(taiga_client_wrapper, session_id, project_id, "issue_priorities")
             return priorities
         except TaigaException as e:
             handle_taiga_exception("getting", "issue priorities", f"project {project_id}", e)
         except Exception as e:
             handle_general_exception("getting", "issue priorities", f"project {project_id}", e)
 
-    @mcp.tool("get_issue_severities", description="Lists the available severities for issues within a specific project.")
+    @threaded_tool(mcp, "get_issue_severities", description="Lists the available severities for issues within a specific project.")
     def get_issue_severities(session_id: str, project_id: int) -> List[Dict[str, Any]]:
         """Retrieves the list of issue severities for a project."""
-        log_operation("get", "issue_severities", session_id, f"for project {project_id}")
+        log_operation("get", "issue_severities", session_id, "for project %s", project_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
-            severities = taiga_client_wrapper.api.issue_severities.list(query_params={"project_id": project_id})
+            severities = _list_issue_metadata(taiga_client_wrapper, session_id, project_id, "issue_severities")
             return severities
         except TaigaException as e:
             handle_taiga_exception("getting", "issue severities", f"project {project_id}", e)
         except Exception as e:
             handle_general_exception("getting", "issue severities", f"project {project_id}", e)
 
-    @mcp.tool("get_issue_types", description="Lists the available types for issues within a specific project.")
+    @threaded_tool(mcp, "get_issue_types", description="Lists the available types for issues within a specific project.")
     def get_issue_types(session_id: str, project_id: int) -> List[Dict[str, Any]]:
         """Retrieves the list of issue types for a project."""
-        log_operation("get", "issue_types", session_id, f"for project {project_id}")
+        log_operation("get", "issue_types", session_id, "for project %s", project_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
-            types = taiga_client_wrapper.api.issue_types.list(query_params={"project_id": project_id})
+            types = _list_issue_metadata(taiga_client_wrapper, session_id, project_id, "issue_types")
             return types
         except TaigaException as e:
             handle_taiga_exception("getting", "issue types", f"project {project_id}", e)
         except Exception as e:
             handle_general_exception("getting", "issue types", f"project {project_id}", e)
+
+    @mcp.tool("get_issue_metadata", description="Lists the available statuses, priorities, severities and types for issues within a specific project in a single call.")
+    async def get_issue_metadata(session_id: str, project_id: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Retrieves issue statuses, priorities, severities and types for a project, fetched concurrently."""
+        log_operation("get", "issue_metadata", session_id, "for project %s", project_id)
+        taiga_client_wrapper = get_authenticated_client(session_id)
+        # Raises the same error a single get_issue_* call would have raised
+        results = await gather_in_threads(
+            partial(taiga_call, "getting", f"issue {key}", f"project {project_id}",
+                    _list_issue_metadata, taiga_client_wrapper, session_id, project_id, resource)
+            for key, resource in ISSUE_METADATA_RESOURCES.items())
+        return dict(zip(ISSUE_METADATA_RESOURCES, results))
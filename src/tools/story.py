@@ -9,10 +9,19 @@ from pytaigaclient.exceptions import TaigaException
 
 from .common import (
     get_authenticated_client, 
+    cached_call,
+    invalidate_cached_calls,
+    LIST_CACHE_TTL,
+    list_up_to,
+    edit_with_version,
+    remember_entity,
+    forget_entity,
     handle_taiga_exception,
     handle_general_exception,
     log_operation,
     log_success,
+    get_session_logger,
+    threaded_tool,
     logger
 )
 
@@ -20,31 +29,38 @@ from .common import (
 def register_story_tools(mcp: FastMCP) -> None:
     """Register user story management tools with the FastMCP instance."""
 
-    @mcp.tool("list_user_stories", description="Lists user stories within a specific project, optionally filtered.")
-    def list_user_stories(session_id: str, project_id: int, **filters) -> List[Dict[str, Any]]:
-        """Lists user stories for a project. Optional filters like 'milestone', 'status', 'assigned_to' can be passed as keyword arguments."""
-        log_operation("list", "user_stories", session_id, f"for project {project_id}, filters: {filters}")
+    @threaded_tool(mcp, "list_user_stories", description="Lists user stories within a specific project, optionally filtered. Set limit to fetch at most that many user stories, page by page.")
+    def list_user_stories(session_id: str, project_id: int, limit: int = None, **filters) -> List[Dict[str, Any]]:
+        """Lists user stories for a project. Optional filters like 'milestone', 'status', 'assigned_to' can be passed as keyword arguments. Optional limit caps the number of user stories returned."""
+        log_operation("list", "user_stories", session_id, "for project %s, filters: %s, limit: %s", project_id, filters, limit)
         taiga_client_wrapper = get_authenticated_client(session_id)
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be a positive number.")
         try:
             # Fix: User stories use **query_params pattern, so pass project with filters
             query_params = {"project": project_id, **filters}
-            stories = taiga_client_wrapper.api.user_stories.list(**query_params)
-            return stories
+            list_page = lambda params: taiga_client_wrapper.api.user_stories.list(**params)
+            # With a limit, only fetch as many pages as needed to fill it
+            return cached_call(
+                ("user_stories", session_id, tuple(sorted(query_params.items())), limit), LIST_CACHE_TTL,
+                lambda: list_page(query_params) if limit is None else list_up_to(list_page, query_params, limit))
         except TaigaException as e:
             handle_taiga_exception("listing", "user stories", f"project {project_id}", e)
         except Exception as e:
             handle_general_exception("listing", "user stories", f"project {project_id}", e)
 
-    @mcp.tool("create_user_story", description="Creates a new user story within a project.")
+    @threaded_tool(mcp, "create_user_story", description="Creates a new user story within a project.")
     def create_user_story(session_id: str, project_id: int, subject: str, **kwargs) -> Dict[str, Any]:
         """Creates a user story. Requires project_id and subject. Optional fields (description, milestone_id, status_id, assigned_to_id, etc.) via kwargs."""
-        log_operation("create", "user_story", session_id, f"'{subject}' in project {project_id}")
+        log_operation("create", "user_story", session_id, "'%s' in project %s", subject, project_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         if not subject:
             raise ValueError("User story subject cannot be empty.")
         try:
             story = taiga_client_wrapper.api.user_stories.create(
                 project=project_id, subject=subject, **kwargs)
+            remember_entity(session_id, "user_stories", story.get('id'), story)
+            invalidate_cached_calls("user_stories", session_id)
             log_success("created", "user story", story.get('id', 'N/A'), subject)
             return story
         except TaigaException as e:
@@ -52,56 +68,56 @@ def register_story_tools(mcp: FastMCP) -> None:
         except Exception as e:
             handle_general_exception("creating", "user story", subject, e)
 
-    @mcp.tool("get_user_story", description="Gets detailed information about a specific user story by its ID.")
+    @threaded_tool(mcp, "get_user_story", description="Gets detailed information about a specific user story by its ID.")
     def get_user_story(session_id: str, user_story_id: int) -> Dict[str, Any]:
         """Retrieves user story details by ID."""
-        log_operation("get", "user_story", session_id, f"ID {user_story_id}")
+        log_operation("get", "user_story", session_id, "ID %s", user_story_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
             story = taiga_client_wrapper.api.user_stories.get(user_story_id)
+            remember_entity(session_id, "user_stories", user_story_id, story)
             return story
         except TaigaException as e:
             handle_taiga_exception("getting", "user story", user_story_id, e)
         except Exception as e:
             handle_general_exception("getting", "user story", user_story_id, e)
 
-    @mcp.tool("update_user_story", description="Updates details of an existing user story.")
-    def update_user_story(session_id: str, user_story_id: int, **kwargs) -> Dict[str, Any]:
-        """Updates a user story. Pass fields to update as keyword arguments (e.g., subject, description, status_id, assigned_to)."""
-        log_operation("update", "user_story", session_id, f"ID {user_story_id} with data: {kwargs}")
+    @threaded_tool(mcp, "update_user_story", description="Updates details of an existing user story.")
+    def update_user_story(session_id: str, user_story_id: int, version: int = None, **kwargs) -> Dict[str, Any]:
+        """Updates a user story. Pass fields to update as keyword arguments (e.g., subject, description, status_id, assigned_to). Optional version (the entity's current version) saves a lookup."""
+        log_operation("update", "user_story", session_id, "ID %s (version %s) with data: %s", user_story_id, version, kwargs)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
             if not kwargs:
-                 logger.info(f"No fields provided for update on user story {user_story_id}")
+                 logger.info("No fields provided for update on user story %s", user_story_id)
                  return taiga_client_wrapper.api.user_stories.get(user_story_id)
 
-            # Get current user story data to retrieve version
-            current_story = taiga_client_wrapper.api.user_stories.get(user_story_id)
-            version = current_story.get('version')
-            if not version:
-                raise ValueError(f"Could not determine version for user story {user_story_id}")
-                
-            # Use edit method for partial updates with **kwargs
-            updated_story = taiga_client_wrapper.api.user_stories.edit(
-                user_story_id=user_story_id,
-                version=version,
-                **kwargs
-            )
-            logger.info(f"User story {user_story_id} update request sent.")
+            # Reuses the version cached from the last read/write when possible
+            updated_story = edit_with_version(
+                session_id, "user_stories", "user story", user_story_id, taiga_client_wrapper.api.user_stories.get,
+                lambda version: taiga_client_wrapper.api.user_stories.edit(
+                    user_story_id=user_story_id,
+                    version=version,
+                    **kwargs
+                ),
+                version=version)
+            invalidate_cached_calls("user_stories", session_id)
+            logger.info("User story %s update request sent.", user_story_id)
             return updated_story
         except TaigaException as e:
             handle_taiga_exception("updating", "user story", user_story_id, e)
         except Exception as e:
             handle_general_exception("updating", "user story", user_story_id, e)
 
-    @mcp.tool("delete_user_story", description="Deletes a user story by its ID.")
+    @threaded_tool(mcp, "delete_user_story", description="Deletes a user story by its ID.")
     def delete_user_story(session_id: str, user_story_id: int) -> Dict[str, Any]:
         """Deletes a user story by ID."""
-        logger.warning(
-            f"Executing delete_user_story ID {user_story_id} for session {session_id[:8]}...")
+        get_session_logger(session_id).warning("Executing delete_user_story ID %s", user_story_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
             taiga_client_wrapper.api.user_stories.delete(user_story_id)
+            forget_entity(session_id, "user_stories", user_story_id)
+            invalidate_cached_calls("user_stories", session_id)
             log_success("deleted", "user story", user_story_id)
             return {"status": "deleted", "user_story_id": user_story_id}
         except TaigaException as e:
@@ -109,28 +125,46 @@ def register_story_tools(mcp: FastMCP) -> None:
         except Exception as e:
             handle_general_exception("deleting", "user story", user_story_id, e)
 
-    @mcp.tool("assign_user_story_to_user", description="Assigns a specific user story to a specific user.")
+    def _set_user_story_assignee(session_id: str, user_story_id: int, user_id: int) -> Dict[str, Any]:
+        """Edits only assigned_to (None unassigns), with the cached version when there is one."""
+        taiga_client_wrapper = get_authenticated_client(session_id)
+        try:
+            updated_story = edit_with_version(
+                session_id, "user_stories", "user story", user_story_id, taiga_client_wrapper.api.user_stories.get,
+                lambda version: taiga_client_wrapper.api.user_stories.edit(
+                    user_story_id=user_story_id,
+                    version=version,
+                    assigned_to=user_id
+                ))
+            invalidate_cached_calls("user_stories", session_id)
+            return updated_story
+        except TaigaException as e:
+            handle_taiga_exception("assigning", "user story", user_story_id, e)
+        except Exception as e:
+            handle_general_exception("assigning", "user story", user_story_id, e)
+
+    @threaded_tool(mcp, "assign_user_story_to_user", description="Assigns a specific user story to a specific user.")
     def assign_user_story_to_user(session_id: str, user_story_id: int, user_id: int) -> Dict[str, Any]:
         """Assigns a user story to a user."""
-        log_operation("assign", "user_story_to_user", session_id, f"US {user_story_id} -> User {user_id}")
-        # Delegate to update_user_story, assuming 'assigned_to' key works
-        return update_user_story(session_id, user_story_id, assigned_to=user_id)
+        log_operation("assign", "user_story_to_user", session_id, "US %s -> User %s", user_story_id, user_id)
+        return _set_user_story_assignee(session_id, user_story_id, user_id)
 
-    @mcp.tool("unassign_user_story_from_user", description="Unassigns a specific user story (sets assigned user to null).")
+    @threaded_tool(mcp, "unassign_user_story_from_user", description="Unassigns a specific user story (sets assigned user to null).")
     def unassign_user_story_from_user(session_id: str, user_story_id: int) -> Dict[str, Any]:
         """Unassigns a user story."""
-        log_operation("unassign", "user_story_from_user", session_id, f"US {user_story_id}")
-        # Delegate to update_user_story with assigned_to=None
-        return update_user_story(session_id, user_story_id, assigned_to=None)
+        log_operation("unassign", "user_story_from_user", session_id, "US %s", user_story_id)
+        return _set_user_story_assignee(session_id, user_story_id, None)
 
-    @mcp.tool("get_user_story_statuses", description="Lists the available statuses for user stories within a specific project.")
+    @threaded_tool(mcp, "get_user_story_statuses", description="Lists the available statuses for user stories within a specific project.")
     def get_user_story_statuses(session_id: str, project_id: int) -> List[Dict[str, Any]]:
         """Retrieves the list of user story statuses for a project."""
-        log_operation("get", "user_story_statuses", session_id, f"for project {project_id}")
+        log_operation("get", "user_story_statuses", session_id, "for project %s", project_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
-            statuses = taiga_client_wrapper.api.userstory_statuses.list(query_params={"project_id": project_id})
-            return statuses
+            query_params = {"project_id": project_id}
+            return cached_call(
+                ("userstory_statuses", session_id, tuple(sorted(query_params.items()))), LIST_CACHE_TTL,
+                lambda: taiga_client_wrapper.api.userstory_statuses.list(query_params=query_params))
         except TaigaException as e:
             handle_taiga_exception("getting", "user story statuses", f"project {project_id}", e)
         except Exception as e:
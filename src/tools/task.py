@@ -3,39 +3,93 @@
 Task management tools for Taiga MCP bridge.
 """
 
-from typing import List, Dict, Any
+from functools import partial
+from typing import List, Dict, Any, Union
+import anyio
 from mcp.server.fastmcp import FastMCP
 from pytaigaclient.exceptions import TaigaException
 
 from .common import (
     get_authenticated_client, 
+    cached_call,
+    invalidate_cached_calls,
+    LIST_CACHE_TTL,
+    list_project_members,
+    list_up_to,
+    edit_with_version,
+    gather_in_threads,
+    get_cached_version,
+    remember_entity,
+    forget_entity,
     handle_taiga_exception,
     handle_general_exception,
     log_operation,
     log_success,
+    get_session_logger,
+    threaded_tool,
+    taiga_call,
     logger
 )
 
 
+def _parse_tags(tags: str) -> List[str]:
+    """Splits comma-separated tags, trimming each once and dropping empty ones."""
+    return [tag for tag in map(str.strip, tags.split(',')) if tag]
+
+
+# (parameter, API field, transform) for the optional fields shared by
+# create_task and update_task
+_TASK_FIELDS = (
+    ("description", "description", None),
+    ("due_date", "due_date", None),
+    # Comma-separated tags become a list; a list is sent as given
+    ("tags", "tags", lambda tags: _parse_tags(tags) if isinstance(tags, str) else list(tags)),
+    ("assigned_to", "assigned_to", None),
+    ("milestone_id", "milestone", None),
+    ("status_id", "status", None),
+    ("user_story_id", "user_story", None),
+)
+
+
+def _task_data(**params: Any) -> Dict[str, Any]:
+    """Maps the task tools' field parameters (by _TASK_FIELDS name) to API fields, skipping unset ones."""
+    return {
+        api_field: transform(value) if transform else value
+        for param, api_field, transform in _TASK_FIELDS
+        if (value := params.get(param)) is not None
+    }
+
+
+# User fields search_users matches the query against
+USER_SEARCH_FIELDS = ("full_name", "username", "email")
+# User fields copied into each search_users match (besides role and is_active)
+USER_RESULT_FIELDS = ("id", "username", "full_name", "email")
+
+
 def register_task_tools(mcp: FastMCP) -> None:
     """Register task management tools with the FastMCP instance."""
 
-    @mcp.tool("list_tasks", description="Lists tasks within a specific project, optionally filtered.")
-    def list_tasks(session_id: str, project_id: int, **filters) -> List[Dict[str, Any]]:
-        """Lists tasks for a project. Optional filters like 'milestone', 'status', 'user_story', 'assigned_to' can be passed as keyword arguments."""
-        log_operation("list", "tasks", session_id, f"for project {project_id}, filters: {filters}")
+    @threaded_tool(mcp, "list_tasks", description="Lists tasks within a specific project, optionally filtered. Set limit to fetch at most that many tasks, page by page.")
+    def list_tasks(session_id: str, project_id: int, limit: int = None, **filters) -> List[Dict[str, Any]]:
+        """Lists tasks for a project. Optional filters like 'milestone', 'status', 'user_story', 'assigned_to' can be passed as keyword arguments. Optional limit caps the number of tasks returned."""
+        log_operation("list", "tasks", session_id, "for project %s, filters: %s, limit: %s", project_id, filters, limit)
         taiga_client_wrapper = get_authenticated_client(session_id)
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be a positive number.")
         try:
             # Fix: Pass filters as query_params dictionary with project included
             query_params = {"project": project_id, **filters}
-            tasks = taiga_client_wrapper.api.tasks.list(query_params=query_params)
-            return tasks
+            list_page = lambda params: taiga_client_wrapper.api.tasks.list(query_params=params)
+            # With a limit, only fetch as many pages as needed to fill it
+            return cached_call(
+                ("tasks", session_id, tuple(sorted(query_params.items())), limit), LIST_CACHE_TTL,
+                lambda: list_page(query_params) if limit is None else list_up_to(list_page, query_params, limit))
         except TaigaException as e:
             handle_taiga_exception("listing", "tasks", f"project {project_id}", e)
         except Exception as e:
             handle_general_exception("listing", "tasks", f"project {project_id}", e)
 
-    @mcp.tool("create_task", description="Creates a new task within a project with full field support.")
+    @threaded_tool(mcp, "create_task", description="Creates a new task within a project with full field support.")
     def create_task(session_id: str, project_id: int, subject: str, description: str = None, 
                    due_date: str = None, tags: str = None, assigned_to: int = None, 
                    milestone_id: int = None, status_id: int = None, user_story_id: int = None, 
@@ -59,35 +113,23 @@ def register_task_tools(mcp: FastMCP) -> None:
         Returns:
             Dict containing the created task details
         """
-        log_operation("create", "task", session_id, f"'{subject}' in project {project_id}")
+        log_operation("create", "task", session_id, "'%s' in project %s", subject, project_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         if not subject:
             raise ValueError("Task subject cannot be empty.")
         
         try:
             # Build task data with all provided fields
-            task_data = {}
-            
-            if description:
-                task_data["description"] = description
-            if due_date:
-                task_data["due_date"] = due_date
-            if tags:
-                # Convert comma-separated tags to list
-                task_data["tags"] = [tag.strip() for tag in tags.split(',') if tag.strip()]
-            if assigned_to:
-                task_data["assigned_to"] = assigned_to
-            if milestone_id:
-                task_data["milestone"] = milestone_id
-            if status_id:
-                task_data["status"] = status_id
-            if user_story_id:
-                task_data["user_story"] = user_story_id
+            task_data = _task_data(
+                description=description, due_date=due_date, tags=tags, assigned_to=assigned_to,
+                milestone_id=milestone_id, status_id=status_id, user_story_id=user_story_id)
                 
             # Add any additional kwargs
             task_data.update(kwargs)
             
             task = taiga_client_wrapper.api.tasks.create(project=project_id, subject=subject, data=task_data)
+            remember_entity(session_id, "tasks", task.get('id'), task)
+            invalidate_cached_calls("tasks", session_id)
             log_success("created", "task", task.get('id', 'N/A'), subject)
             return task
         except TaigaException as e:
@@ -95,24 +137,25 @@ def register_task_tools(mcp: FastMCP) -> None:
         except Exception as e:
             handle_general_exception("creating", "task", subject, e)
 
-    @mcp.tool("get_task", description="Gets detailed information about a specific task by its ID.")
+    @threaded_tool(mcp, "get_task", description="Gets detailed information about a specific task by its ID.")
     def get_task(session_id: str, task_id: int) -> Dict[str, Any]:
         """Retrieves task details by ID."""
-        log_operation("get", "task", session_id, f"ID {task_id}")
+        log_operation("get", "task", session_id, "ID %s", task_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
             task = taiga_client_wrapper.api.tasks.get(task_id)
+            remember_entity(session_id, "tasks", task_id, task)
             return task
         except TaigaException as e:
             handle_taiga_exception("getting", "task", task_id, e)
         except Exception as e:
             handle_general_exception("getting", "task", task_id, e)
 
-    @mcp.tool("update_task", description="Updates details of an existing task with full field support.")
+    @threaded_tool(mcp, "update_task", description="Updates details of an existing task with full field support.")
     def update_task(session_id: str, task_id: int, subject: str = None, description: str = None,
-                   due_date: str = None, tags: str = None, assigned_to: int = None,
+                   due_date: str = None, tags: Union[str, List[str]] = None, assigned_to: int = None,
                    milestone_id: int = None, status_id: int = None, user_story_id: int = None,
-                   **kwargs) -> Dict[str, Any]:
+                   version: int = None, **kwargs) -> Dict[str, Any]:
         """
         Updates a task with comprehensive field support.
         
@@ -122,75 +165,61 @@ def register_task_tools(mcp: FastMCP) -> None:
             subject: New task title/subject
             description: Updated task description (Markdown supported)
             due_date: Due date in YYYY-MM-DD format
-            tags: Comma-separated tags (e.g., "frontend,urgent,bug")
+            tags: Comma-separated tags (e.g., "frontend,urgent,bug") or a list of tags
             assigned_to: User ID to assign task to
             milestone_id: Milestone/sprint ID to assign task to
             status_id: Status ID for the task
             user_story_id: User story ID to link task to
+            version: The task's current version, if known (saves a lookup)
             **kwargs: Additional fields (is_blocked, blocked_note, etc.)
         
         Returns:
             Dict containing the updated task details
         """
-        log_operation("update", "task", session_id, f"ID {task_id}")
+        log_operation("update", "task", session_id, "ID %s (version %s)", task_id, version)
         taiga_client_wrapper = get_authenticated_client(session_id)
         
         # Build update data from provided parameters
-        update_data = {}
-        
+        update_data = _task_data(
+            description=description, due_date=due_date, tags=tags, assigned_to=assigned_to,
+            milestone_id=milestone_id, status_id=status_id, user_story_id=user_story_id)
         if subject is not None:
             update_data["subject"] = subject
-        if description is not None:
-            update_data["description"] = description
-        if due_date is not None:
-            update_data["due_date"] = due_date
-        if tags is not None:
-            # Convert comma-separated tags to list
-            update_data["tags"] = [tag.strip() for tag in tags.split(',') if tag.strip()]
-        if assigned_to is not None:
-            update_data["assigned_to"] = assigned_to
-        if milestone_id is not None:
-            update_data["milestone"] = milestone_id
-        if status_id is not None:
-            update_data["status"] = status_id
-        if user_story_id is not None:
-            update_data["user_story"] = user_story_id
             
         # Add any additional kwargs
         update_data.update(kwargs)
         
         try:
             if not update_data:
-                 logger.info(f"No fields provided for update on task {task_id}")
+                 logger.info("No fields provided for update on task %s", task_id)
                  return taiga_client_wrapper.api.tasks.get(task_id)
 
-            # Get current task data to retrieve version
-            current_task = taiga_client_wrapper.api.tasks.get(task_id)
-            version = current_task.get('version')
-            if not version:
-                raise ValueError(f"Could not determine version for task {task_id}")
-                
-            # Use edit method for partial updates with data dictionary
-            updated_task = taiga_client_wrapper.api.tasks.edit(
-                task_id=task_id,
-                version=version,
-                data=update_data
-            )
-            logger.info(f"Task {task_id} update request sent.")
+            # Reuses the version cached from the last read/write when possible
+            updated_task = edit_with_version(
+                session_id, "tasks", "task", task_id, taiga_client_wrapper.api.tasks.get,
+                lambda version: taiga_client_wrapper.api.tasks.edit(
+                    task_id=task_id,
+                    version=version,
+                    data=update_data
+                ),
+                version=version)
+            invalidate_cached_calls("tasks", session_id)
+            logger.info("Task %s update request sent.", task_id)
             return updated_task
         except TaigaException as e:
             handle_taiga_exception("updating", "task", task_id, e)
         except Exception as e:
             handle_general_exception("updating", "task", task_id, e)
 
-    @mcp.tool("delete_task", description="Deletes a task by its ID.")
+    @threaded_tool(mcp, "delete_task", description="Deletes a task by its ID.")
     def delete_task(session_id: str, task_id: int) -> Dict[str, Any]:
         """Deletes a task by ID."""
-        logger.warning(
-            f"Executing delete_task ID {task_id} for session {session_id[:8]}...")
+        get_session_logger(session_id).warning("Executing delete_task ID %s", task_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
             taiga_client_wrapper.api.tasks.delete(task_id)
+            forget_entity(session_id, "tasks", task_id)
+            invalidate_cached_calls("tasks", session_id)
             log_success("deleted", "task", task_id)
             return {"status": "deleted", "task_id": task_id}
         except TaigaException as e:
@@ -198,21 +227,37 @@ def register_task_tools(mcp: FastMCP) -> None:
         except Exception as e:
             handle_general_exception("deleting", "task", task_id, e)
 
-    @mcp.tool("assign_task_to_user", description="Assigns a specific task to a specific user.")
+    def _set_task_assignee(session_id: str, task_id: int, user_id: int) -> Dict[str, Any]:
+        """Edits only assigned_to (None unassigns), with the cached version when there is one."""
+        taiga_client_wrapper = get_authenticated_client(session_id)
+        try:
+            updated_task = edit_with_version(
+                session_id, "tasks", "task", task_id, taiga_client_wrapper.api.tasks.get,
+                lambda version: taiga_client_wrapper.api.tasks.edit(
+                    task_id=task_id,
+                    version=version,
+                    data={"assigned_to": user_id}
+                ))
+            invalidate_cached_calls("tasks", session_id)
+            return updated_task
+        except TaigaException as e:
+            handle_taiga_exception("assigning", "task", task_id, e)
+        except Exception as e:
+            handle_general_exception("assigning", "task", task_id, e)
+
+    @threaded_tool(mcp, "assign_task_to_user", description="Assigns a specific task to a specific user.")
     def assign_task_to_user(session_id: str, task_id: int, user_id: int) -> Dict[str, Any]:
         """Assigns a task to a user."""
-        log_operation("assign", "task_to_user", session_id, f"Task {task_id} -> User {user_id}")
-        # Delegate to update_task
-        return update_task(session_id, task_id, assigned_to=user_id)
+        log_operation("assign", "task_to_user", session_id, "Task %s -> User %s", task_id, user_id)
+        return _set_task_assignee(session_id, task_id, user_id)
 
-    @mcp.tool("unassign_task_from_user", description="Unassigns a specific task (sets assigned user to null).")
+    @threaded_tool(mcp, "unassign_task_from_user", description="Unassigns a specific task (sets assigned user to null).")
     def unassign_task_from_user(session_id: str, task_id: int) -> Dict[str, Any]:
         """Unassigns a task."""
-        log_operation("unassign", "task_from_user", session_id, f"Task {task_id}")
-        # Delegate to update_task
-        return update_task(session_id, task_id, assigned_to=None)
+        log_operation("unassign", "task_from_user", session_id, "Task %s", task_id)
+        return _set_task_assignee(session_id, task_id, None)
     
-    @mcp.tool("search_users", description="Search for users by name or email within a project.")
+    @threaded_tool(mcp, "search_users", description="Search for users by name or email within a project.")
     def search_users(session_id: str, project_id: int, query: str) -> List[Dict[str, Any]]:
         """
         Search for users by name or email within a project context.
@@ -225,43 +270,65 @@ def register_task_tools(mcp: FastMCP) -> None:
         Returns:
             List of matching users with their details
         """
-        log_operation("search", "users", session_id, f"query '{query}' in project {project_id}")
-        taiga_client_wrapper = get_authenticated_client(session_id)
+        log_operation("search", "users", session_id, "query '%s' in project %s", query, project_id)
+        get_authenticated_client(session_id)
         try:
-            # First get project members as the most relevant users
-            members = taiga_client_wrapper.api.memberships.list(query_params={"project": project_id})
+            # First get project members as the most relevant users; the list is
+            # cached briefly and shared with get_project_members, so repeated
+            # searches (e.g. bulk assignment) don't refetch it
+            members = list_project_members(session_id, project_id)
             
             # Filter members by the search query
             matching_users = []
-            query_lower = query.lower()
+            needle = query.casefold()
             
             for member in members:
-                user = member.get('user', {})
-                full_name = user.get('full_name', '').lower()
-                username = user.get('username', '').lower()
-                email = user.get('email', '').lower()
-                
-                if (query_lower in full_name or 
-                    query_lower in username or 
-                    query_lower in email):
-                    matching_users.append({
-                        'id': user.get('id'),
-                        'username': user.get('username'),
-                        'full_name': user.get('full_name'),
-                        'email': user.get('email'),
-                        'role': member.get('role_name'),
-                        'is_active': user.get('is_active', False)
-                    })
+                user = member.get('user') or {}
+                if any(needle in (user.get(field) or '').casefold() for field in USER_SEARCH_FIELDS):
+                    # .get rather than itemgetter: Taiga omits some fields (e.g. email)
+                    match = {field: user.get(field) for field in USER_RESULT_FIELDS}
+                    match['role'] = member.get('role_name')
+                    match['is_active'] = user.get('is_active', False)
+                    matching_users.append(match)
             
-            logger.info(f"Found {len(matching_users)} users matching '{query}'")
+            logger.info("Found %s users matching '%s'", len(matching_users), query)
             return matching_users
         except TaigaException as e:
             handle_taiga_exception("searching", "users", query, e)
         except Exception as e:
             handle_general_exception("searching", "users", query, e)
     
+    def _assign_to_match(session_id: str, task_id: int, project_id: int, username: str,
+                         users: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Assigns a task given the search_users matches for a username."""
+        if not users:
+            raise ValueError(f"No user found matching '{username}' in project {project_id}")
+
+        if len(users) > 1:
+            # Return multiple matches for user to choose from
+            return {
+                "status": "multiple_matches",
+                "message": f"Multiple users found matching '{username}'. Please specify:",
+                "users": users,
+                "suggestion": "Use assign_task_to_user with specific user ID"
+            }
+
+        # Single match found - assign the task
+        user = users[0]
+        # Copy so the cached task snapshot is not mutated
+        result = {**_set_task_assignee(session_id, task_id, user['id']), 'assigned_user': user}
+        logger.info("Task %s assigned to %s (ID: %s)", task_id, user['full_name'], user['id'])
+        return result
+
+    def _prefetch_task_version(session_id: str, task_id: int) -> None:
+        """Caches the task's current version so the assignment needs no extra GET."""
+        if get_cached_version(session_id, "tasks", task_id) is None:
+            taiga_client_wrapper = get_authenticated_client(session_id)
+            task = taiga_call("getting", "task", task_id, taiga_client_wrapper.api.tasks.get, task_id)
+            remember_entity(session_id, "tasks", task_id, task)
+
     @mcp.tool("assign_task_by_username", description="Assigns a task to a user by their username or name.")
-    def assign_task_by_username(session_id: str, task_id: int, project_id: int, username: str) -> Dict[str, Any]:
+    async def assign_task_by_username(session_id: str, task_id: int, project_id: int, username: str) -> Dict[str, Any]:
         """
         Assigns a task to a user by searching for them by username or name.
         
@@ -274,38 +341,134 @@ def register_task_tools(mcp: FastMCP) -> None:
         Returns:
             Dict containing the updated task with assignment details
         """
-        log_operation("assign", "task_by_username", session_id, f"Task {task_id} -> {username}")
+        log_operation("assign", "task_by_username", session_id, "Task %s -> %s", task_id, username)
         
         try:
-            # Search for the user
-            users = search_users(session_id, project_id, username)
-            
-            if not users:
-                raise ValueError(f"No user found matching '{username}' in project {project_id}")
-            
-            if len(users) > 1:
-                # Return multiple matches for user to choose from
-                return {
-                    "status": "multiple_matches",
-                    "message": f"Multiple users found matching '{username}'. Please specify:",
-                    "users": users,
-                    "suggestion": "Use assign_task_to_user with specific user ID"
-                }
-            
-            # Single match found - assign the task
-            user = users[0]
-            result = update_task(session_id, task_id, assigned_to=user['id'])
-            result['assigned_user'] = user
-            logger.info(f"Task {task_id} assigned to {user['full_name']} (ID: {user['id']})")
-            return result
+            # The user search and the task's version lookup are independent; run them together
+            users, _ = await gather_in_threads([
+                partial(search_users, session_id, project_id, username),
+                partial(_prefetch_task_version, session_id, task_id),
+            ])
+            return await anyio.to_thread.run_sync(
+                partial(_assign_to_match, session_id, task_id, project_id, username, users))
             
         except ValueError as e:
-            logger.error(f"User search error: {e}")
-            raise e
+            logger.error("User search error: %s", e)
+            raise
+        except (TaigaException, RuntimeError):
+            # Already logged and shaped by search_users, _prefetch_task_version's
+            # taiga_call, or _set_task_assignee's handlers
+            raise
         except Exception as e:
-            handle_general_exception("assigning task by username", f"task {task_id}", e)
+            handle_general_exception("assigning", "task by username", task_id, e)
+
+    @mcp.tool("bulk_assign_tasks_by_username", description="Assigns several tasks to users by username or name in one call. Each assignment is {'task_id': id, 'username': name}; results are reported per task.")
+    async def bulk_assign_tasks_by_username(session_id: str, project_id: int, assignments: List[Dict[str, Any]],
+                                            max_concurrent: int = 8) -> Dict[str, Any]:
+        """
+        Assigns multiple tasks by username concurrently.
+        
+        Args:
+            session_id: User session ID
+            project_id: Project ID where the tasks exist
+            assignments: List of {"task_id": <task ID>, "username": <username, full name or email>}
+            max_concurrent: Maximum number of Taiga requests in flight at once
+        
+        Returns:
+            Dict with per-task results in request order and assigned/failed counts
+        """
+        log_operation("bulk_assign", "tasks_by_username", session_id, "%s tasks in project %s", len(assignments), project_id)
+        # Fail fast on a bad session instead of once per assignment
+        get_authenticated_client(session_id)
+        limiter = anyio.CapacityLimiter(max(1, max_concurrent))
+
+        async def _safely(fn, *args):
+            try:
+                return await anyio.to_thread.run_sync(partial(fn, *args), limiter=limiter)
+            except Exception as e:
+                return e
+
+        # Search each distinct username once, while prefetching task versions
+        usernames = [name for name in dict.fromkeys(item.get("username") for item in assignments) if name]
+        task_ids = [task_id for task_id in dict.fromkeys(item.get("task_id") for item in assignments)
+                    if task_id is not None]
+        matches: Dict[str, Any] = {}
+        async with anyio.create_task_group() as tg:
+            async def _search(name: str) -> None:
+                matches[name] = await _safely(search_users, session_id, project_id, name)
+
+            for name in usernames:
+                tg.start_soon(_search, name)
+            for task_id in task_ids:
+                tg.start_soon(_safely, _prefetch_task_version, session_id, task_id)
+
+        results: List[Dict[str, Any]] = [{} for _ in assignments]
+        async with anyio.create_task_group() as tg:
+            async def _assign(index: int, item: Dict[str, Any]) -> None:
+                task_id, name = item.get("task_id"), item.get("username")
+                users = matches.get(name)
+                if task_id is None or not name:
+                    result = ValueError("Each assignment needs a task_id and a username.")
+                elif isinstance(users, Exception):
+                    result = users
+                else:
+                    result = await _safely(_assign_to_match, session_id, task_id, project_id, name, users)
+
+                if isinstance(result, Exception):
+                    results[index] = {"task_id": task_id, "username": name, "status": "error", "error": str(result)}
+                elif result.get("status") == "multiple_matches":
+                    results[index] = {"task_id": task_id, "username": name, **result}
+                else:
+                    results[index] = {"task_id": task_id, "username": name, "status": "success", "task": result}
 
-    @mcp.tool("get_task_activity", description="Gets activity timeline for a specific task.")
+            for index, item in enumerate(assignments):
+                tg.start_soon(_assign, index, item)
+
+        assigned = sum(1 for result in results if result["status"] == "success")
+        logger.info("Bulk assignment finished: %s/%s tasks assigned.", assigned, len(assignments))
+        return {
+            "results": results,
+            "assigned": assigned,
+            "failed": len(assignments) - assigned,
+        }
+
+    @mcp.tool("bulk_search_users", description="Runs several user searches, possibly across projects, in one call. Each search is {'project_id': id, 'query': text}; results are reported per search.")
+    async def bulk_search_users(session_id: str, searches: List[Dict[str, Any]],
+                                max_concurrent: int = 8) -> List[Dict[str, Any]]:
+        """
+        Runs multiple search_users queries concurrently.
+        
+        Args:
+            session_id: User session ID
+            searches: List of {"project_id": <project ID>, "query": <name, username or email>}
+            max_concurrent: Maximum number of Taiga requests in flight at once
+        
+        Returns:
+            Per-search results in request order, each with the matching users or an error
+        """
+        log_operation("bulk_search", "users", session_id, "%s searches", len(searches))
+        # Fail fast on a bad session instead of once per search
+        get_authenticated_client(session_id)
+        limiter = anyio.CapacityLimiter(max(1, max_concurrent))
+        results: List[Dict[str, Any]] = [{} for _ in searches]
+
+        async def _search(index: int, item: Dict[str, Any]) -> None:
+            project_id, query = item.get("project_id"), item.get("query")
+            try:
+                if project_id is None or not query:
+                    raise ValueError("Each search needs a project_id and a query.")
+                users = await anyio.to_thread.run_sync(
+                    partial(search_users, session_id, project_id, query), limiter=limiter)
+                results[index] = {"project_id": project_id, "query": query, "status": "success", "users": users}
+            except Exception as e:
+                results[index] = {"project_id": project_id, "query": query, "status": "error", "error": str(e)}
+
+        async with anyio.create_task_group() as tg:
+            for index, item in enumerate(searches):
+                tg.start_soon(_search, index, item)
+        return results
+
+    @threaded_tool(mcp, "get_task_activity", description="Gets activity timeline for a specific task.")
     def get_task_activity(session_id: str, task_id: int) -> List[Dict[str, Any]]:
         """
         Gets the activity timeline/history for a task.
@@ -317,34 +480,33 @@ def register_task_tools(mcp: FastMCP) -> None:
         Returns:
             List of activity entries for the task
         """
-        log_operation("get", "task_activity", session_id, f"for task {task_id}")
+        log_operation("get", "task_activity", session_id, "for task %s", task_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         try:
-            # Get user timeline and filter for this task
+            # Get user timeline and keep only this task's entries (other
+            # tasks' "tasks.*" events are not this task's activity)
             timeline = taiga_client_wrapper.api.timeline.user_timeline()
+            task_activities = [
+                {
+                    'id': entry.get('id'),
+                    'event_type': entry.get('event_type'),
+                    'created': entry.get('created'),
+                    'data': data,
+                    'user': entry.get('user', {}),
+                    'description': data.get('comment', '')
+                }
+                for entry in timeline
+                if ((data := entry.get('data') or {}).get('task') or {}).get('id') == task_id
+            ]
             
-            # Filter timeline entries related to this task
-            task_activities = []
-            for entry in timeline:
-                if (entry.get('data', {}).get('task', {}).get('id') == task_id or 
-                    entry.get('event_type', '').startswith('tasks.')):
-                    task_activities.append({
-                        'id': entry.get('id'),
-                        'event_type': entry.get('event_type'),
-                        'created': entry.get('created'),
-                        'data': entry.get('data', {}),
-                        'user': entry.get('user', {}),
-                        'description': entry.get('data', {}).get('comment', '')
-                    })
-            
-            logger.info(f"Found {len(task_activities)} activity entries for task {task_id}")
+            logger.info("Found %s activity entries for task %s", len(task_activities), task_id)
             return task_activities
         except TaigaException as e:
             handle_taiga_exception("getting", "task activity", task_id, e)
         except Exception as e:
             handle_general_exception("getting", "task activity", task_id, e)
             
-    @mcp.tool("add_task_tags", description="Adds tags to an existing task.")
+    @threaded_tool(mcp, "add_task_tags", description="Adds tags to an existing task.")
     def add_task_tags(session_id: str, task_id: int, new_tags: str) -> Dict[str, Any]:
         """
         Adds new tags to an existing task without removing existing ones.
@@ -357,23 +519,25 @@ def register_task_tools(mcp: FastMCP) -> None:
         Returns:
             Dict containing the updated task with new tags
         """
-        log_operation("add", "task_tags", session_id, f"'{new_tags}' to task {task_id}")
+        log_operation("add", "task_tags", session_id, "'%s' to task %s", new_tags, task_id)
         taiga_client_wrapper = get_authenticated_client(session_id)
         
         try:
-            # Get current task to merge tags
+            # Get current task to merge tags; caching it lets update_task
+            # edit with this version instead of fetching the task again
             current_task = taiga_client_wrapper.api.tasks.get(task_id)
-            current_tags = current_task.get('tags', [])
+            remember_entity(session_id, "tasks", task_id, current_task)
+            current_tags = current_task.get('tags') or []
             
             # Parse new tags
-            new_tag_list = [tag.strip() for tag in new_tags.split(',') if tag.strip()]
+            new_tag_list = _parse_tags(new_tags)
             
-            # Merge with existing tags (avoid duplicates)
-            all_tags = list(set(current_tags + new_tag_list))
+            # Merge with existing tags, keeping their order (avoid duplicates)
+            all_tags = list(dict.fromkeys(current_tags + new_tag_list))
             
             # Update the task with merged tags
-            result = update_task(session_id, task_id, tags=','.join(all_tags))
-            logger.info(f"Added tags {new_tag_list} to task {task_id}. Total tags: {len(all_tags)}")
+            result = update_task(session_id, task_id, tags=all_tags)
+            logger.info("Added tags %s to task %s. Total tags: %s", new_tag_list, task_id, len(all_tags))
             return result
             
         except TaigaException as e: